@@ -0,0 +1,119 @@
+/*
+ * SIMD kernel for the tolerance-based target color replacement of color_remover.py.
+ *
+ * Build as a shared library next to color_remover.py:
+ *
+ *     cc -O3 -shared -fPIC -o _color_remover_ext.so _color_remover_ext.c
+ *
+ * The AVX2 path is compiled via a function target attribute and selected at
+ * runtime, so the library also works on CPUs without AVX2 (scalar fallback).
+ * color_remover.py loads it with ctypes and falls back to NumPy if it is missing.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+#if defined(__x86_64__) || defined(__i386__)
+#include <immintrin.h>
+#define HAVE_X86 1
+#endif
+
+static void process_tolerance_scalar(
+    const uint8_t *rgba, uint8_t *out, size_t n,
+    uint8_t tr, uint8_t tg, uint8_t tb,
+    uint8_t rr, uint8_t rg, uint8_t rb,
+    uint8_t tol, int32_t tol_dist_sq)
+{
+    for (size_t i = 0; i < n; i++) {
+        const uint8_t *px = rgba + 4 * i;
+        uint8_t *o = out + 4 * i;
+
+        int dr = abs(px[0] - tr);
+        int dg = abs(px[1] - tg);
+        int db = abs(px[2] - tb);
+        int max_channel_diff = dr > dg ? (dr > db ? dr : db) : (dg > db ? dg : db);
+        int32_t distance_sq = dr * dr + dg * dg + db * db;
+
+        if (max_channel_diff <= tol || distance_sq <= tol_dist_sq) {
+            o[0] = rr;
+            o[1] = rg;
+            o[2] = rb;
+        } else {
+            o[0] = px[0];
+            o[1] = px[1];
+            o[2] = px[2];
+        }
+        o[3] = px[3];
+    }
+}
+
+#ifdef HAVE_X86
+/*
+ * Process 8 RGBA pixels (one 256-bit register) per iteration. Returns the number
+ * of pixels handled; the remainder is left to the scalar loop.
+ */
+__attribute__((target("avx2")))
+static size_t process_tolerance_avx2(
+    const uint8_t *rgba, uint8_t *out, size_t n,
+    uint8_t tr, uint8_t tg, uint8_t tb,
+    uint8_t rr, uint8_t rg, uint8_t rb,
+    uint8_t tol, int32_t tol_dist_sq)
+{
+    const __m256i target = _mm256_set1_epi32(tr | (tg << 8) | (tb << 16));
+    const __m256i replacement = _mm256_set1_epi32(rr | (rg << 8) | (rb << 16));
+    const __m256i rgb_bytes = _mm256_set1_epi32(0x00FFFFFF);
+    const __m256i low_byte = _mm256_set1_epi32(0xFF);
+    const __m256i tol_v = _mm256_set1_epi32(tol);
+    const __m256i dist_v = _mm256_set1_epi32(tol_dist_sq);
+
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        __m256i px = _mm256_loadu_si256((const __m256i *)(rgba + 4 * i));
+
+        /* Branchless |px - target| per byte via two saturating subtractions */
+        __m256i d = _mm256_or_si256(_mm256_subs_epu8(px, target), _mm256_subs_epu8(target, px));
+        d = _mm256_and_si256(d, rgb_bytes);
+
+        /* Deinterleave the channel differences into one 32-bit lane per pixel */
+        __m256i dr = _mm256_and_si256(d, low_byte);
+        __m256i dg = _mm256_and_si256(_mm256_srli_epi32(d, 8), low_byte);
+        __m256i db = _mm256_srli_epi32(d, 16);
+
+        __m256i max_channel_diff = _mm256_max_epu8(_mm256_max_epu8(dr, dg), db);
+        __m256i distance_sq = _mm256_add_epi32(
+            _mm256_add_epi32(_mm256_mullo_epi32(dr, dr), _mm256_mullo_epi32(dg, dg)),
+            _mm256_mullo_epi32(db, db));
+
+        /* A pixel is kept only if it fails both tests */
+        __m256i keep = _mm256_and_si256(
+            _mm256_cmpgt_epi32(max_channel_diff, tol_v),
+            _mm256_cmpgt_epi32(distance_sq, dist_v));
+
+        /* Replacement color with the pixel's own alpha */
+        __m256i replaced = _mm256_or_si256(_mm256_andnot_si256(rgb_bytes, px), replacement);
+
+        _mm256_storeu_si256((__m256i *)(out + 4 * i), _mm256_blendv_epi8(replaced, px, keep));
+    }
+    return i;
+}
+#endif
+
+void process_tolerance(
+    const uint8_t *rgba, uint8_t *out, size_t n,
+    uint8_t tr, uint8_t tg, uint8_t tb,
+    uint8_t rr, uint8_t rg, uint8_t rb,
+    uint8_t tol, int32_t tol_dist_sq)
+{
+    size_t done = 0;
+
+#ifdef HAVE_X86
+    if (__builtin_cpu_supports("avx2")) {
+        done = process_tolerance_avx2(rgba, out, n, tr, tg, tb, rr, rg, rb, tol, tol_dist_sq);
+    }
+#endif
+
+    process_tolerance_scalar(
+        rgba + 4 * done, out + 4 * done, n - done,
+        tr, tg, tb, rr, rg, rb, tol, tol_dist_sq);
+}
@@ -0,0 +1,64 @@
+# encoding: utf-8
+
+"""
+Numba kernels for color_remover.py.
+
+Each mode has its own kernel so the per-pixel loop has no mode branch. The
+explicit signatures compile the kernels when this module is imported; with
+cache=True the machine code is stored in __pycache__ and reused by later runs.
+color_remover.py imports this module only the first time a frame takes the
+Numba path, so runs that never do pay neither the Numba import nor the JIT.
+"""
+
+from numba import njit, prange, types
+import numpy as np
+
+_FRAME_IN = types.Array(types.uint8, 3, "C", readonly=True)
+_FRAME_OUT = types.Array(types.uint8, 3, "C")
+
+@njit(inline="always")
+def _write_pixel(arr_in, arr_out, y, x, replace, rr, rg, rb):
+    """Write either the replacement color or the original pixel, keeping its alpha."""
+    if replace:
+        arr_out[y, x, 0] = rr
+        arr_out[y, x, 1] = rg
+        arr_out[y, x, 2] = rb
+    else:
+        arr_out[y, x, 0] = arr_in[y, x, 0]
+        arr_out[y, x, 1] = arr_in[y, x, 1]
+        arr_out[y, x, 2] = arr_in[y, x, 2]
+    arr_out[y, x, 3] = arr_in[y, x, 3]
+
+@njit(types.void(_FRAME_IN, _FRAME_OUT, *[types.int32] * 3), parallel=True, cache=True)
+def kernel_bw(arr_in, arr_out, rr, rg, rb):
+    """Replace every pixel that is not exactly black or white, one row per thread."""
+    height, width = arr_in.shape[0], arr_in.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            r, g, b = arr_in[y, x, 0], arr_in[y, x, 1], arr_in[y, x, 2]
+            is_black = (r | g | b) == 0
+            is_white = (r & g & b) == 255
+            _write_pixel(arr_in, arr_out, y, x, not (is_black or is_white), rr, rg, rb)
+
+@njit(types.void(_FRAME_IN, _FRAME_OUT, *[types.int32] * 4), parallel=True, cache=True)
+def kernel_bw_tolerance(arr_in, arr_out, rr, rg, rb, tol):
+    """Replace every pixel that is not black or white within tol, one row per thread."""
+    height, width = arr_in.shape[0], arr_in.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            r, g, b = arr_in[y, x, 0], arr_in[y, x, 1], arr_in[y, x, 2]
+            is_black = max(r, g, b) <= tol
+            is_white = min(r, g, b) >= 255 - tol
+            _write_pixel(arr_in, arr_out, y, x, not (is_black or is_white), rr, rg, rb)
+
+@njit(types.void(_FRAME_IN, _FRAME_OUT, *[types.int32] * 8), parallel=True, cache=True)
+def kernel_target(arr_in, arr_out, tr, tg, tb, rr, rg, rb, tol, tol_dist_sq):
+    """Replace every pixel matching the target color, one row per thread."""
+    height, width = arr_in.shape[0], arr_in.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            dr = abs(np.int32(arr_in[y, x, 0]) - tr)
+            dg = abs(np.int32(arr_in[y, x, 1]) - tg)
+            db = abs(np.int32(arr_in[y, x, 2]) - tb)
+            replace = max(dr, dg, db) <= tol or dr * dr + dg * dg + db * db <= tol_dist_sq
+            _write_pixel(arr_in, arr_out, y, x, replace, rr, rg, rb)
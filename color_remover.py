@@ -47,6 +47,12 @@ including PNG, JPG, and GIF.
    python color_remover.py input.png output.png -s "#ff0000" -t 40
    ```
 
+6. Write the processed pixels as raw RGBA bytes, e.g. for further processing in a script
+   (the output has the input's dimensions; GIF frames are written one after another):
+   ```bash
+   python color_remover.py input.gif output.rgba -s "#ff0000" --raw
+   ```
+
 ## Options
 
 ```
@@ -54,15 +60,31 @@ including PNG, JPG, and GIF.
 -r, --replace TEXT     Color to replace with (default: white)
 -b, --bw, --bw-only    Keep only black and white pixels
 -t, --tolerance INT    Color matching tolerance (0-255, default: 30)
+--pillow               Use Pillow's C image operations instead of NumPy
+--raw                  Write raw RGBA bytes (frames one after another) instead of an encoded image
 ```
 
 # Installation
 
-1. Ensure you have Python 3.6 or higher installed
+1. Ensure you have Python 3.9 or higher installed
 2. Install required dependencies:
    ```bash
    pip install -r requirements.txt
    ```
+3. Optionally install Numba to speed up processing of large images:
+   ```bash
+   pip install numba
+   ```
+4. When using `--pillow`, optionally replace Pillow with the SIMD accelerated
+   [pillow-simd](https://github.com/uploadcare/pillow-simd) drop-in:
+   ```bash
+   pip uninstall pillow && pip install pillow-simd
+   ```
+5. Optionally build the SIMD extension (AVX2, with a scalar fallback) that speeds up
+   color matching with tolerance. It is picked up automatically when present:
+   ```bash
+   cc -O3 -shared -fPIC -o _color_remover_ext.so _color_remover_ext.c
+   ```
 
 # License
 
@@ -74,10 +96,22 @@ from rich import traceback
 from rich import pretty
 from rich.console import Console
 import typer
-from PIL import Image, ImageSequence
+from PIL import Image, ImageChops, ImageMath, ImageSequence
 from typing import Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
+import ctypes
+import importlib.util
+import math
+import multiprocessing
 import os
 
+# Numba is optional; without it every frame goes through the NumPy path. The
+# kernels in _color_remover_kernels.py are only imported on first use.
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
 pretty.install()
 traceback.install()
 console = Console()
@@ -90,31 +124,102 @@ app = typer.Typer(
     epilog="To get help about the script, call it with the --help option."
 )
 
-def is_color_match(pixel: Tuple[int, ...], target_color: Tuple[int, ...], tolerance: int = 30) -> bool:
+# Frames with more pixels than this use the Numba kernels (if available); for
+# smaller frames importing Numba and loading the kernels is not worth it
+NUMBA_MIN_PIXELS = 250_000
+
+# GIF stacks with fewer pixels than this are processed in this process. Starting
+# the worker pool re-imports the modules in every worker and takes about half a
+# second, which the NumPy path spends on some 50 million pixels.
+POOL_MIN_PIXELS = 64_000_000
+
+# Optional SIMD extension for the tolerance compare, see _color_remover_ext.c
+def _load_simd_ext(path: Optional[str] = None) -> Optional[ctypes.CDLL]:
+    """Load the compiled SIMD extension (by default from next to this script), if it was built."""
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_color_remover_ext.so")
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    lib.process_tolerance.argtypes = (
+        [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+        + [ctypes.c_uint8] * 7
+        + [ctypes.c_int32]
+    )
+    lib.process_tolerance.restype = None
+    return lib
+
+SIMD_EXT = _load_simd_ext()
+
+# Pixels per strip processed at a time on the NumPy path (1 MiB of RGBA)
+TILE_PIXELS = 512 * 512
+
+# Largest number of colors precomputed into a lookup table; beyond that the
+# table would fill most of the RGB cube and direct arithmetic is cheaper
+LUT_MAX_ENTRIES = 1 << 22
+
+def _distance_tolerance_sq(tolerance: int) -> int:
     """
-    Check if a pixel matches a target color, handling both RGB and RGBA with tolerance.
-    Uses a combination of individual channel differences and overall color similarity.
+    Return the squared Euclidean distance tolerance for a channel tolerance.
+
+    The distance tolerance is tolerance * 2.5, since the Euclidean distance is
+    naturally larger. Its square is floor(25 * tolerance^2 / 4), computed in
+    integers so squared distances can be compared without a square root.
     """
-    pixel_rgb = pixel[:3]
-    target_rgb = target_color[:3]
+    return 25 * tolerance * tolerance // 4
 
-    # Calculate differences for each channel
-    r_diff = abs(pixel_rgb[0] - target_rgb[0])
-    g_diff = abs(pixel_rgb[1] - target_rgb[1])
-    b_diff = abs(pixel_rgb[2] - target_rgb[2])
+def _lut_bounds(target_color: Tuple[int, int, int], tolerance: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the inclusive (low, high) range per channel of colors that can match target_color."""
+    # Both tests bound every channel difference by the larger of the tolerance
+    # and the square root of the squared distance tolerance
+    reach = max(tolerance, math.isqrt(_distance_tolerance_sq(tolerance)))
+    return tuple((max(0, c - reach), min(255, c + reach)) for c in target_color)
 
-    # Calculate overall color difference (Euclidean distance)
-    color_distance = (r_diff ** 2 + g_diff ** 2 + b_diff ** 2) ** 0.5
+def _lut_entries(target_color: Tuple[int, int, int], tolerance: int) -> int:
+    """Number of colors that have to be evaluated to build the lookup table."""
+    return math.prod(high - low + 1 for low, high in _lut_bounds(target_color, tolerance))
 
-    # Use a combination of:
-    # 1. Maximum individual channel difference
-    max_channel_diff = max(r_diff, g_diff, b_diff)
+@lru_cache(maxsize=4)
+def _color_lut(target_color: Tuple[int, int, int], tolerance: int) -> np.ndarray:
+    """
+    Build a boolean lookup table over all 2^24 colors, indexed by the packed value
+    r | g << 8 | b << 16, that marks the colors matching target_color.
 
-    # 2. Overall color difference
-    # Scale tolerance for Euclidean distance since it's naturally larger
-    distance_tolerance = tolerance * 2.5
+    Only the box of colors that can match is evaluated; the rest stays zero.
+    """
+    lut = np.zeros((256, 256, 256), dtype=np.bool_)  # indexed [b, g, r]
+    (r_lo, r_hi), (g_lo, g_hi), (b_lo, b_hi) = _lut_bounds(target_color, tolerance)
+    tr, tg, tb = target_color
+
+    dr = np.abs(np.arange(r_lo, r_hi + 1, dtype=np.int32) - tr)[None, None, :]
+    dg = np.abs(np.arange(g_lo, g_hi + 1, dtype=np.int32) - tg)[None, :, None]
+    db = np.abs(np.arange(b_lo, b_hi + 1, dtype=np.int32) - tb)[:, None, None]
+    max_channel_diff = np.maximum(np.maximum(dr, dg), db)
+    distance_sq = dr * dr + dg * dg + db * db
+    lut[b_lo:b_hi + 1, g_lo:g_hi + 1, r_lo:r_hi + 1] = (
+        (max_channel_diff <= tolerance) | (distance_sq <= _distance_tolerance_sq(tolerance))
+    )
+
+    return lut.reshape(-1)
 
-    return (max_channel_diff <= tolerance) or (color_distance <= distance_tolerance)
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Return the multiprocessing context for the frame worker pool.
+
+    Once a frame has gone through the Numba kernels, Numba's threading layer is
+    running; workers forked from such a process inherit it in a broken state and
+    hang on exit. Workers are therefore started from a clean forkserver (or
+    spawned where that is not available).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
 
 def process_image(
     input_path: str,
@@ -122,7 +227,9 @@ def process_image(
     target_color: Optional[Tuple[int, int, int]] = None,
     replacement_color: Tuple[int, int, int] = (255, 255, 255),
     keep_only_bw: bool = False,
-    tolerance: int = 30
+    tolerance: int = 30,
+    use_pillow: bool = False,
+    raw: bool = False
 ) -> None:
     """
     Process an image by removing/replacing colors.
@@ -134,76 +241,333 @@ def process_image(
         replacement_color: Color to use for replacement
         keep_only_bw: If True, keeps only black and white pixels
         tolerance: How much each RGB component can differ (default: 30)
+        use_pillow: If True, use Pillow's C image operations instead of NumPy
+        raw: If True, write the processed pixels as raw RGBA bytes instead of
+            encoding an image file (all frames of a GIF one after another)
     """
     # Get file extension
     _, ext = os.path.splitext(input_path.lower())
 
     with Image.open(input_path) as im:
         if ext == '.gif':
-            frames = []
-            for frame in ImageSequence.Iterator(im):
-                processed_frame = process_single_frame(
-                    frame, target_color, replacement_color, keep_only_bw, tolerance
-                )
-                frames.append(processed_frame)
-
-            # Save as GIF
-            frames[0].save(
+            # Decode all frames into one preallocated (N, H, W, 4) stack
+            width, height = im.size
+            n_frames = getattr(im, "n_frames", 1)
+            stack = np.empty((n_frames, height, width, 4), dtype=np.uint8)
+            if use_pillow:
+                # The Pillow backend works on the decoded frames as images
+                for i, frame in enumerate(ImageSequence.Iterator(im)):
+                    stack[i] = np.asarray(process_single_frame_pillow(
+                        frame, target_color, replacement_color, tolerance
+                    ))
+            else:
+                for i, frame in enumerate(ImageSequence.Iterator(im)):
+                    stack[i] = _rgba_array(frame)
+                _process_stack(stack, target_color, replacement_color, tolerance)
+
+            if raw:
+                save_raw(output_path, stack)
+                return
+
+            # Save as GIF; the remaining frames are only wrapped as images when
+            # the encoder asks for them
+            first_frame = Image.fromarray(stack[0], "RGBA")
+            first_frame.save(
                 output_path,
                 save_all=True,
-                append_images=frames[1:],
+                append_images=(Image.fromarray(stack[i], "RGBA") for i in range(1, n_frames)),
                 loop=im.info.get('loop', 0),
                 duration=im.info.get('duration', 100),
                 disposal=2
             )
         else:
             # Process single image
+            if raw and not use_pillow:
+                processed = process_frame_array(
+                    _rgba_array(im), target_color, replacement_color, tolerance
+                )
+                save_raw(output_path, processed)
+                return
+
             processed_image = process_single_frame(
-                im, target_color, replacement_color, keep_only_bw, tolerance
+                im, target_color, replacement_color, keep_only_bw, tolerance, use_pillow
             )
+            if raw:
+                save_raw(output_path, np.asarray(processed_image))
+                return
             processed_image.save(output_path)
 
+def _process_stack(
+    stack: np.ndarray,
+    target_color: Optional[Tuple[int, int, int]],
+    replacement_color: Tuple[int, int, int],
+    tolerance: int
+) -> None:
+    """Process an (N, H, W, 4) uint8 stack of RGBA frames in place."""
+    n_frames, _, width, _ = stack.shape
+
+    # Consecutive frames form one tall frame, so a group of frames is
+    # transformed in a single call. A stack large enough to pay for starting
+    # the worker pool is split into one group per CPU and the groups are
+    # transformed in parallel; the transform is CPU bound, so processes are
+    # used to avoid the GIL. The Numba kernels already use every CPU, so a
+    # stack they handle is sent through them as one tall frame rather than
+    # once per worker.
+    pixels = stack[..., 0].size
+    if pixels < POOL_MIN_PIXELS or _uses_numba(pixels, target_color):
+        n_groups = 1
+    else:
+        n_groups = min(n_frames, _available_cpus())
+    groups = np.array_split(stack, n_groups)
+    tall_frames = [group.reshape(-1, width, 4) for group in groups]
+    if len(tall_frames) > 1:
+        args = (
+            repeat(target_color), repeat(replacement_color), repeat(tolerance)
+        )
+        with ProcessPoolExecutor(len(tall_frames), mp_context=_pool_context()) as executor:
+            processed = executor.map(process_frame_array, tall_frames, *args)
+            # The workers return copies; write them back into the stack
+            for group, result in zip(groups, processed):
+                group[...] = result.reshape(group.shape)
+    else:
+        # A single tall frame is a view of the whole stack, so it is
+        # transformed in place
+        process_frame_array(
+            tall_frames[0], target_color, replacement_color, tolerance, out=tall_frames[0]
+        )
+
+def save_raw(output_path: str, pixels: np.ndarray) -> None:
+    """
+    Write a uint8 pixel array to output_path as raw bytes through a memory map,
+    bypassing Pillow's encoders.
+    """
+    output = np.memmap(output_path, dtype=np.uint8, mode="w+", shape=pixels.shape)
+    output[...] = pixels
+    output.flush()
+    del output
+
+def _rgba_array(image: Image.Image) -> np.ndarray:
+    """Return an image as an (H, W, 4) uint8 array, converting only if it is not RGBA yet."""
+    if image.mode == "RGBA":
+        return np.asarray(image)
+    return np.asarray(image.convert("RGBA"))
+
 def process_single_frame(
     image: Image.Image,
     target_color: Optional[Tuple[int, int, int]],
     replacement_color: Tuple[int, int, int],
     keep_only_bw: bool,
-    tolerance: int = 30
+    tolerance: int = 30,
+    use_pillow: bool = False
 ) -> Image.Image:
     """Process a single image or frame."""
-    # Convert to RGB mode and ensure no color profile transformations
-    frame_rgb = image.convert("RGB")
-    frame_rgba = Image.new('RGBA', frame_rgb.size)
-    pixels = frame_rgb.load()
-    width, height = frame_rgb.size
-
-    for y in range(height):
-        for x in range(width):
-            px = pixels[x, y]
-            if target_color is not None:
-                if is_color_match(px, target_color, tolerance):
-                    frame_rgba.putpixel((x, y), (*replacement_color, 255))
-                else:
-                    frame_rgba.putpixel((x, y), (*px, 255))
-            elif keep_only_bw:
-                # Use tolerance for black and white detection
-                is_black = all(abs(c - 0) <= tolerance for c in px[:3])
-                is_white = all(abs(c - 255) <= tolerance for c in px[:3])
-                if is_black or is_white:
-                    frame_rgba.putpixel((x, y), (*px, 255))
-                else:
-                    frame_rgba.putpixel((x, y), (*replacement_color, 255))
-            else:
-                # Remove all colors except black and white, with tolerance
-                is_black = all(abs(c - 0) <= tolerance for c in px[:3])
-                is_white = all(abs(c - 255) <= tolerance for c in px[:3])
-                if is_black or is_white:
-                    frame_rgba.putpixel((x, y), (*px, 255))
-                else:
-                    frame_rgba.putpixel((x, y), (*replacement_color, 255))
+    if use_pillow:
+        return process_single_frame_pillow(image, target_color, replacement_color, tolerance)
+
+    # Work on the whole frame as a contiguous (H, W, 4) uint8 array instead of
+    # per pixel. np.asarray shares PIL's buffer where possible.
+    frame = _rgba_array(image)
+    processed = process_frame_array(frame, target_color, replacement_color, tolerance)
+    return Image.fromarray(processed, "RGBA")
+
+def _uses_numba(pixels: int, target_color: Optional[Tuple[int, int, int]]) -> bool:
+    """Return whether process_frame_array uses the Numba kernels for a frame of this size."""
+    if SIMD_EXT is not None and target_color is not None:
+        return False
+    return NUMBA_AVAILABLE and pixels > NUMBA_MIN_PIXELS
+
+def process_frame_array(
+    frame: np.ndarray,
+    target_color: Optional[Tuple[int, int, int]],
+    replacement_color: Tuple[int, int, int],
+    tolerance: int = 30,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Process a single frame given as an (H, W, 4) uint8 RGBA array.
 
-    return frame_rgba
+    Without a target_color only black and white pixels are kept, which is also
+    what keep_only_bw selects, so there is no separate flag for it.
 
+    The result is written to out if given (a contiguous array of the same shape,
+    which may be frame itself), otherwise to a new array.
+    """
+    height, width = frame.shape[:2]
+
+    if SIMD_EXT is not None and target_color is not None:
+        frame = np.ascontiguousarray(frame)
+        if out is None:
+            out = np.empty_like(frame)
+        SIMD_EXT.process_tolerance(
+            frame.ctypes.data, out.ctypes.data, height * width,
+            *target_color, *replacement_color,
+            tolerance, _distance_tolerance_sq(tolerance)
+        )
+        return out
+
+    if _uses_numba(height * width, target_color):
+        # Fused kernels read and write each pixel once
+        import _color_remover_kernels as kernels
+        frame = np.ascontiguousarray(frame)
+        if out is None:
+            out = np.empty_like(frame)
+        if target_color is not None:
+            kernels.kernel_target(
+                frame, out, *target_color, *replacement_color,
+                tolerance, _distance_tolerance_sq(tolerance)
+            )
+        elif tolerance == 0:
+            kernels.kernel_bw(frame, out, *replacement_color)
+        else:
+            kernels.kernel_bw_tolerance(frame, out, *replacement_color, tolerance)
+        return out
+
+    frame = np.ascontiguousarray(frame)
+    replacement = np.array(replacement_color, dtype=np.uint8)
+
+    # Pick the mask function for the mode once, not per strip
+    if target_color is None:
+        replace_mask = _mask_bw if tolerance == 0 else _mask_bw_tolerance
+    elif _lut_entries(target_color, tolerance) <= min(LUT_MAX_ENTRIES, height * width):
+        replace_mask = _mask_target_lut
+    else:
+        replace_mask = _mask_target
+
+    # Process strips of full rows of about TILE_PIXELS each, so the mask and its
+    # intermediates stay in cache while the strip is read and written
+    if out is None:
+        out = np.empty((height, width, 4), dtype=np.uint8)
+    strip_rows = max(1, TILE_PIXELS // width)
+    for y0 in range(0, height, strip_rows):
+        strip = frame[y0:y0 + strip_rows]
+        out_strip = out[y0:y0 + strip_rows]
+        mask = replace_mask(strip, target_color, tolerance)
+
+        # Copy the strip as is, then overwrite only the RGB bytes of the masked
+        # pixels so the alpha channel is left untouched
+        out_strip[...] = strip
+        np.copyto(out_strip[..., :3], replacement, where=mask[..., None])
+
+    return out
+
+# The mask functions below take a contiguous (H, W, 4) uint8 RGBA array and
+# return a boolean (H, W) mask of the pixels to replace.
+
+def _mask_target_lut(
+    frame: np.ndarray,
+    target_color: Tuple[int, int, int],
+    tolerance: int
+) -> np.ndarray:
+    """Match the target color with one table lookup per pixel on the packed RGB value."""
+    keys = frame.view("<u4")[..., 0] & 0x00FFFFFF
+    return _color_lut(target_color, tolerance)[keys]
+
+def _mask_target(
+    frame: np.ndarray,
+    target_color: Tuple[int, int, int],
+    tolerance: int
+) -> np.ndarray:
+    """
+    Match the target color using a combination of the maximum individual channel
+    difference and the overall color difference (Euclidean distance).
+    """
+    r, g, b = frame[..., 0], frame[..., 1], frame[..., 2]
+
+    # Absolute differences stay in uint8 as max(a, b) - min(a, b), which
+    # cannot wrap; only the squared distance is widened to int32
+    tr, tg, tb = np.array(target_color, dtype=np.uint8)
+    dr = np.maximum(r, tr) - np.minimum(r, tr)
+    dg = np.maximum(g, tg) - np.minimum(g, tg)
+    db = np.maximum(b, tb) - np.minimum(b, tb)
+    max_channel_diff = np.maximum(np.maximum(dr, dg), db)
+    dr, dg, db = dr.astype(np.int32), dg.astype(np.int32), db.astype(np.int32)
+    distance_sq = dr * dr + dg * dg + db * db
+
+    return (max_channel_diff <= tolerance) | (distance_sq <= _distance_tolerance_sq(tolerance))
+
+def _mask_bw(
+    frame: np.ndarray,
+    target_color: None,
+    tolerance: int
+) -> np.ndarray:
+    """Match everything but exact black and white."""
+    # View each RGBA pixel as one little-endian uint32 and drop the alpha
+    # byte, so the test is two integer compares
+    packed = frame.view("<u4")[..., 0] & 0x00FFFFFF
+    return (packed != 0) & (packed != 0x00FFFFFF)
+
+def _mask_bw_tolerance(
+    frame: np.ndarray,
+    target_color: None,
+    tolerance: int
+) -> np.ndarray:
+    """Match everything but black and white within the tolerance."""
+    # Plain uint8 comparisons on the channel planes, no casts needed
+    r, g, b = frame[..., 0], frame[..., 1], frame[..., 2]
+    is_black = np.maximum(np.maximum(r, g), b) <= tolerance
+    is_white = np.minimum(np.minimum(r, g), b) >= 255 - tolerance
+    return ~(is_black | is_white)
+
+def process_single_frame_pillow(
+    image: Image.Image,
+    target_color: Optional[Tuple[int, int, int]],
+    replacement_color: Tuple[int, int, int],
+    tolerance: int = 30
+) -> Image.Image:
+    """
+    Process a single image or frame using only Pillow's C image operations.
+
+    Masks are built from ImageChops/ImageMath results and per-band point() lookup
+    tables, so no Python code runs per pixel. With pillow-simd installed in place
+    of Pillow these operations are SIMD accelerated; the code path is identical.
+    """
+    if image.mode == "P" and "transparency" in image.info:
+        image = image.convert("RGBA")
+    frame_rgb = image if image.mode == "RGB" else image.convert("RGB")
+
+    if target_color is not None:
+        diff = ImageChops.difference(frame_rgb, Image.new("RGB", frame_rgb.size, target_color))
+        dr, dg, db = diff.split()
+
+        # Maximum individual channel difference: AND (darker) of per-band thresholds
+        within = [band.point(lambda v: 255 if v <= tolerance else 0) for band in (dr, dg, db)]
+        channel_match = ImageChops.darker(ImageChops.darker(within[0], within[1]), within[2])
+
+        # Overall color difference, compared as squared Euclidean distance
+        max_distance_sq = _distance_tolerance_sq(tolerance)
+        distance_match = ImageMath.lambda_eval(
+            lambda args: (
+                args["r"] * args["r"] + args["g"] * args["g"] + args["b"] * args["b"]
+                <= max_distance_sq
+            ) * 255,
+            r=dr, g=dg, b=db
+        ).convert("L")
+
+        # Replace where either test matches (OR is lighter)
+        mask = ImageChops.lighter(channel_match, distance_match)
+        fill = Image.new("RGB", frame_rgb.size, replacement_color)
+        result = Image.composite(fill, frame_rgb, mask)
+    else:
+        # Reduce the bands to their per-pixel maximum and minimum first, so a
+        # single point() lookup table per test decides black and white
+        r, g, b = frame_rgb.split()
+        brightest = ImageChops.lighter(ImageChops.lighter(r, g), b)
+        darkest = ImageChops.darker(ImageChops.darker(r, g), b)
+        is_black = brightest.point(lambda v: 255 if v <= tolerance else 0)
+        is_white = darkest.point(lambda v: 255 if v >= 255 - tolerance else 0)
+
+        # Keep black and white pixels, replace everything else
+        keep = ImageChops.lighter(is_black, is_white)
+        fill = Image.new("RGB", frame_rgb.size, replacement_color)
+        result = Image.composite(frame_rgb, fill, keep)
+
+    # Keep the original alpha channel, if any
+    result = result.convert("RGBA")
+    if "A" in image.getbands():
+        result.putalpha(image.getchannel("A"))
+    return result
+
+@lru_cache(maxsize=32)
 def parse_color(color_str: str) -> Tuple[int, int, int]:
     """Parse a color string in either RGB format ('255,0,0') or hex format ('#RRGGBB')."""
     if not color_str:
@@ -259,6 +623,16 @@ def main(
         30,
         "--tolerance", "-t",
         help="Color matching tolerance (0-255, default: 30)"
+    ),
+    use_pillow: bool = typer.Option(
+        False,
+        "--pillow",
+        help="Use Pillow's C image operations instead of NumPy (fastest with pillow-simd)"
+    ),
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Write raw RGBA bytes (frames one after another) instead of an encoded image"
     )
 ):
     """Process an image by removing or replacing colors."""
@@ -283,7 +657,9 @@ def main(
             target_rgb,
             replacement_rgb,
             keep_only_bw,
-            tolerance
+            tolerance,
+            use_pillow,
+            raw
         )
 
         console.print(f"[green]Successfully processed image and saved to '{output_file}'[/green]")
@@ -0,0 +1,305 @@
+"""
+Parity tests for the color_remover backends.
+
+Every code path of process_frame_array (NumPy strips, NumPy lookup table, Numba
+kernels, SIMD extension) and the Pillow backend must give the same pixels as a
+per-pixel implementation of the matching rules. GIF stacks, serial or through
+the worker pool, must give the same pixels as processing each frame on its own,
+and so must the raw output files.
+
+Run with: python -m unittest test_color_remover (or pytest)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from typing import Optional, Tuple
+from unittest import mock
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+import color_remover as cr
+
+# An odd pixel count, so the SIMD extension also runs its scalar tail
+HEIGHT, WIDTH = 37, 41
+
+TARGET_COLOR = (10, 200, 30)
+REPLACEMENT_COLOR = (1, 2, 3)
+
+# (target_color, tolerance) cases; None selects black and white mode
+CASES = (
+    [(TARGET_COLOR, t) for t in (0, 2, 30, 255)]
+    + [(None, t) for t in (0, 10, 128, 255)]
+)
+
+def make_frame() -> np.ndarray:
+    """Random RGBA frame with many pixels near the target color, black and white."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (HEIGHT, WIDTH, 4), dtype=np.uint8)
+    pixels = frame.reshape(-1, 4)
+    kind = rng.integers(0, 5, len(pixels))
+    offsets = np.where(
+        rng.random((len(pixels), 1)) < 0.5,
+        rng.integers(-4, 5, (len(pixels), 3)),
+        rng.integers(-40, 41, (len(pixels), 3))
+    )
+    near_target = np.clip(np.array(TARGET_COLOR) + offsets, 0, 255)
+    pixels[kind == 1, :3] = near_target[kind == 1]
+    pixels[kind == 2, :3] = np.abs(offsets[kind == 2])
+    pixels[kind == 3, :3] = 255 - np.abs(offsets[kind == 3])
+
+    # The last pixels, which the SIMD extension handles in its scalar tail, sit
+    # exactly on the tolerance boundaries
+    pixels[-5:, :3] = [
+        (13, 204, 30),   # distance 5, the distance tolerance for 2
+        (13, 204, 31),   # just outside it
+        (55, 140, 30),   # distance 75, the distance tolerance for 30
+        (10, 10, 10),    # black within tolerance 10
+        (245, 245, 245)  # white within tolerance 10
+    ]
+    return frame
+
+def reference(
+    frame: np.ndarray,
+    target_color: Optional[Tuple[int, int, int]],
+    replacement_color: Tuple[int, int, int],
+    tolerance: int
+) -> np.ndarray:
+    """Process a frame one pixel at a time, keeping each pixel's alpha."""
+    out = frame.copy()
+    for y, x in np.ndindex(frame.shape[:2]):
+        r, g, b = (int(c) for c in frame[y, x, :3])
+        if target_color is not None:
+            diffs = [abs(c - t) for c, t in zip((r, g, b), target_color)]
+            color_distance = sum(d * d for d in diffs) ** 0.5
+            replace = max(diffs) <= tolerance or color_distance <= tolerance * 2.5
+        else:
+            is_black = all(c <= tolerance for c in (r, g, b))
+            is_white = all(c >= 255 - tolerance for c in (r, g, b))
+            replace = not (is_black or is_white)
+        if replace:
+            out[y, x, :3] = replacement_color
+    return out
+
+class ProcessFrameArrayParityTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = make_frame()
+
+    def assert_matches_reference(self, cases=CASES):
+        for target_color, tolerance in cases:
+            with self.subTest(target_color=target_color, tolerance=tolerance):
+                expected = reference(self.frame, target_color, REPLACEMENT_COLOR, tolerance)
+                processed = cr.process_frame_array(
+                    self.frame, target_color, REPLACEMENT_COLOR, tolerance
+                )
+                np.testing.assert_array_equal(processed, expected)
+
+                # Writing the result over the input must give the same pixels
+                frame = self.frame.copy()
+                cr.process_frame_array(
+                    frame, target_color, REPLACEMENT_COLOR, tolerance, out=frame
+                )
+                np.testing.assert_array_equal(frame, expected)
+
+    def test_numpy_strips(self):
+        # Strips of 4 rows, so the last strip is a partial one
+        with mock.patch.multiple(
+            cr, SIMD_EXT=None, NUMBA_AVAILABLE=False, LUT_MAX_ENTRIES=0, TILE_PIXELS=4 * WIDTH
+        ):
+            self.assert_matches_reference()
+
+    def test_numpy_lut(self):
+        # The full-range tolerances would evaluate all 2^24 colors, so leave them out
+        lut_cases = [(TARGET_COLOR, t) for t in (0, 2, 30)]
+        with mock.patch.multiple(cr, SIMD_EXT=None, NUMBA_AVAILABLE=False), \
+                mock.patch.object(cr, "_lut_entries", return_value=0):
+            self.assert_matches_reference(lut_cases)
+
+    @unittest.skipUnless(cr.NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba(self):
+        with mock.patch.multiple(cr, SIMD_EXT=None, NUMBA_MIN_PIXELS=0):
+            self.assert_matches_reference()
+
+    @unittest.skipUnless(shutil.which("cc"), "no C compiler")
+    def test_simd_extension(self):
+        source = os.path.join(os.path.dirname(os.path.abspath(cr.__file__)), "_color_remover_ext.c")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "_color_remover_ext.so")
+            subprocess.run(["cc", "-O3", "-shared", "-fPIC", "-o", path, source], check=True)
+            simd_ext = cr._load_simd_ext(path)
+            self.assertIsNotNone(simd_ext)
+
+            # The extension only handles target color mode
+            target_cases = [case for case in CASES if case[0] is not None]
+            with mock.patch.multiple(cr, SIMD_EXT=simd_ext, NUMBA_AVAILABLE=False):
+                self.assert_matches_reference(target_cases)
+
+    def test_pillow(self):
+        image = Image.fromarray(self.frame, "RGBA")
+        for target_color, tolerance in CASES:
+            with self.subTest(target_color=target_color, tolerance=tolerance):
+                processed = cr.process_single_frame(
+                    image, target_color, REPLACEMENT_COLOR, target_color is None, tolerance,
+                    use_pillow=True
+                )
+                np.testing.assert_array_equal(
+                    np.asarray(processed),
+                    reference(self.frame, target_color, REPLACEMENT_COLOR, tolerance)
+                )
+
+    def test_pillow_rgb_input(self):
+        # RGB images are processed without a conversion and come out opaque
+        image = Image.fromarray(np.ascontiguousarray(self.frame[..., :3]), "RGB")
+        opaque = self.frame.copy()
+        opaque[..., 3] = 255
+        for target_color, tolerance in CASES:
+            with self.subTest(target_color=target_color, tolerance=tolerance):
+                processed = cr.process_single_frame(
+                    image, target_color, REPLACEMENT_COLOR, target_color is None, tolerance,
+                    use_pillow=True
+                )
+                np.testing.assert_array_equal(
+                    np.asarray(processed),
+                    reference(opaque, target_color, REPLACEMENT_COLOR, tolerance)
+                )
+
+    def test_pillow_palette_transparency(self):
+        # Palette images keep their transparent index as alpha 0
+        palette = [TARGET_COLOR, (13, 204, 30), (0, 0, 0), (128, 128, 128)]
+        indices = np.random.default_rng(1).integers(0, len(palette), (HEIGHT, WIDTH), dtype=np.uint8)
+        image = Image.fromarray(indices, "L").convert("P")
+        image.putpalette([c for color in palette for c in color])
+        image.info["transparency"] = 3
+        rgba = np.asarray(image.convert("RGBA"))
+        for target_color, tolerance in CASES:
+            with self.subTest(target_color=target_color, tolerance=tolerance):
+                processed = cr.process_single_frame(
+                    image, target_color, REPLACEMENT_COLOR, target_color is None, tolerance,
+                    use_pillow=True
+                )
+                np.testing.assert_array_equal(
+                    np.asarray(processed),
+                    reference(rgba, target_color, REPLACEMENT_COLOR, tolerance)
+                )
+
+def make_gif(path: str, n_frames: int = 5) -> None:
+    """Write an animated GIF whose frames are shifted copies of make_frame()."""
+    frame = make_frame()
+    frames = [
+        Image.fromarray(np.ascontiguousarray(np.roll(frame, 7 * i, axis=1)[..., :3]), "RGB")
+        for i in range(n_frames)
+    ]
+    frames[0].save(path, save_all=True, append_images=frames[1:], loop=0, duration=80)
+
+def decode_gif(path: str) -> list:
+    """Return the frames of a GIF as (H, W, 4) uint8 arrays."""
+    with Image.open(path) as im:
+        return [cr._rgba_array(frame).copy() for frame in ImageSequence.Iterator(im)]
+
+class ProcessStackTest(unittest.TestCase):
+    def setUp(self):
+        frame = make_frame()
+        self.stack = np.stack([np.roll(frame, 7 * i, axis=1) for i in range(5)])
+
+    def assert_stack_matches_frames(self, cpus, cases=CASES):
+        for target_color, tolerance in cases:
+            with self.subTest(cpus=cpus, target_color=target_color, tolerance=tolerance):
+                expected = [
+                    cr.process_frame_array(frame, target_color, REPLACEMENT_COLOR, tolerance)
+                    for frame in self.stack
+                ]
+                stack = self.stack.copy()
+                cr._process_stack(stack, target_color, REPLACEMENT_COLOR, tolerance)
+                for processed, frame in zip(stack, expected):
+                    np.testing.assert_array_equal(processed, frame)
+
+    def test_single_group(self):
+        with mock.patch.object(cr, "_available_cpus", return_value=1):
+            self.assert_stack_matches_frames(1)
+
+    def test_pool(self):
+        # 5 frames over 3 workers gives groups of different sizes. Every case
+        # starts a pool, so only one per mode is run.
+        with mock.patch.object(cr, "POOL_MIN_PIXELS", 0), \
+                mock.patch.object(cr, "_available_cpus", return_value=3), \
+                mock.patch.object(cr, "ProcessPoolExecutor", wraps=cr.ProcessPoolExecutor) as pool:
+            self.assert_stack_matches_frames(3, [(TARGET_COLOR, 30), (None, 128)])
+        self.assertEqual(pool.call_count, 2)
+
+    def test_process_image_gif(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "in.gif")
+            make_gif(input_path)
+            target_color, tolerance = TARGET_COLOR, 30
+
+            # Save the per-frame results the way process_image saves its stack
+            expected_path = os.path.join(tmp, "expected.gif")
+            frames = [
+                Image.fromarray(
+                    cr.process_frame_array(frame, target_color, REPLACEMENT_COLOR, tolerance),
+                    "RGBA"
+                )
+                for frame in decode_gif(input_path)
+            ]
+            frames[0].save(
+                expected_path, save_all=True, append_images=frames[1:],
+                loop=0, duration=80, disposal=2
+            )
+
+            output_path = os.path.join(tmp, "out.gif")
+            cr.process_image(input_path, output_path, target_color, REPLACEMENT_COLOR, False, tolerance)
+
+            output, expected = decode_gif(output_path), decode_gif(expected_path)
+            self.assertEqual(len(output), 5)
+            for processed, frame in zip(output, expected):
+                np.testing.assert_array_equal(processed, frame)
+
+class RawOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def read_raw(self, path: str, shape: Tuple[int, ...]) -> np.ndarray:
+        return np.fromfile(path, dtype=np.uint8).reshape(shape)
+
+    def test_gif_stack(self):
+        input_path = os.path.join(self.tmp.name, "in.gif")
+        output_path = os.path.join(self.tmp.name, "out.rgba")
+        make_gif(input_path)
+        for target_color, tolerance in CASES:
+            with self.subTest(target_color=target_color, tolerance=tolerance):
+                expected = [
+                    cr.process_frame_array(frame, target_color, REPLACEMENT_COLOR, tolerance)
+                    for frame in decode_gif(input_path)
+                ]
+                cr.process_image(
+                    input_path, output_path, target_color, REPLACEMENT_COLOR,
+                    target_color is None, tolerance, raw=True
+                )
+                np.testing.assert_array_equal(
+                    self.read_raw(output_path, (len(expected), HEIGHT, WIDTH, 4)),
+                    np.stack(expected)
+                )
+
+    def test_single_frame(self):
+        frame = make_frame()
+        input_path = os.path.join(self.tmp.name, "in.png")
+        output_path = os.path.join(self.tmp.name, "out.rgba")
+        Image.fromarray(frame, "RGBA").save(input_path)
+        for use_pillow in (False, True):
+            for target_color, tolerance in CASES:
+                with self.subTest(use_pillow=use_pillow, target_color=target_color, tolerance=tolerance):
+                    cr.process_image(
+                        input_path, output_path, target_color, REPLACEMENT_COLOR,
+                        target_color is None, tolerance, use_pillow, raw=True
+                    )
+                    np.testing.assert_array_equal(
+                        self.read_raw(output_path, frame.shape),
+                        cr.process_frame_array(frame, target_color, REPLACEMENT_COLOR, tolerance)
+                    )
+
+if __name__ == "__main__":
+    unittest.main()